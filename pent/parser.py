@@ -24,16 +24,18 @@ r"""*Mini-language parser for* ``pent``.
 
 """
 
+import functools
 import itertools as itt
 import re
+import shlex
 
 import attr
 
 from .enums import SpaceAfter, ParserField, Content
-from .errors import SectionError
+from .errors import LineError, SectionError
 from .patterns import std_wordify_open, std_wordify_close
 from .thrulist import ThruList
-from .token import Token
+from .token import Token, _token_info
 
 
 @attr.s(slots=True)
@@ -225,10 +227,8 @@ class Parser:
             pass
 
         # If it's a single line
-        try:
+        if isinstance(sec, str):
             return cls.convert_line(sec, capture_groups=capture_groups)[0]
-        except AttributeError:
-            pass
 
         # If it's an iterable of lines
         def gen_converted_lines():
@@ -242,9 +242,9 @@ class Parser:
         try:
             return r"\n?".join(gen_converted_lines())
 
-        except AttributeError:  # pragma: no cover
-            # Happens to be the exception that the internals
-            # throw when the wrong type is passed.
+        except TypeError:
+            # Raised by convert_line for any non-str line, or by
+            # the iteration itself if sec isn't iterable
             raise SectionError("Unrecognized format")
 
     @classmethod
@@ -258,89 +258,26 @@ class Parser:
         `group_id` indicates the starting value of the index for any
         capture groups added.
 
-        """
-        import shlex
-
-        from .errors import LineError
-
-        # Parse line into tokens, and then into Tokens
-        tokens = shlex.split(line)
-        tokens = list(Token(_, do_capture=capture_groups) for _ in tokens)
-
-        # Zero-length start of line (or of entire string) match
-        pattern = r"(^|(?<=\n))"
-
-        # Replacement target for the opening paren if the line is optional
-        pattern += "{opline_open}"
-
-        # Always have optional starting whitespace
-        pattern += r"[ \t]*"
-
-        # Initialize flag for a preceding no-space-after num token
-        prior_no_space_token = False
-
-        # Initialize flag for whether the line is optional
-        optional_line = False
-
-        for i, t in enumerate(tokens):
-            tok_pattern = t.pattern
-
-            if t.is_optional_line:
-                if i == 0:
-                    optional_line = True
-                    continue
-                else:
-                    raise LineError(line)
+        Results are cached, so converting the same line repeatedly
+        is cheap.
 
-            if t.needs_group_id:
-                tok_pattern = tok_pattern.format(str(group_id))
-                group_id += 1
+        Raises :exc:`TypeError` if `line` is not a |str|.
 
-            if t.is_any:
-                pattern += tok_pattern
-                prior_no_space_token = False
+        """
+        _check_line_type(line)
+        return _convert_line(line, capture_groups, group_id)
 
-            else:
-                if not prior_no_space_token:
-                    tok_pattern = std_wordify_open(tok_pattern)
+    @classmethod
+    def compile_line(cls, line, *, capture_groups=True, group_id=0):
+        """Convert line of tokens to a compiled regex.
 
-                if t.space_after is SpaceAfter.Required:
-                    tok_pattern = std_wordify_close(tok_pattern)
-                    prior_no_space_token = False
-                else:
-                    prior_no_space_token = True
-
-                pattern += tok_pattern
-
-            # Add required space, optional space, or no space, depending
-            # on what the token calls for, as long as it's not
-            # the last token
-            if i < len(tokens) - 1:
-                if t.space_after is SpaceAfter.Required:
-                    pattern += r"[ \t]+"
-                elif t.space_after is SpaceAfter.Optional:
-                    pattern += r"[ \t]*"
-
-        # Always put possible whitespace to the end of the line.
-        # Also include a format tag for closing optional-line grouping
-        pattern += r"[ \t]*{opline_close}"
-
-        # Per #89, this lookahead must also be optional for an
-        # optional line
-        pattern += "($|(?=\n))" + ("?" if optional_line else "")
-
-        # Wrap pattern with parens and '?' if it's optional
-        # Otherwise just drop the formatting tags.
-        #
-        # The leading question mark in the opline_open
-        # substitution is to make the SOL/SOF lookbehind
-        # optional in the case of an optional line, per #89.
-        pattern = pattern.format(
-            opline_open=("?(" if optional_line else ""),
-            opline_close=(")?" if optional_line else ""),
-        )
+        Identical to :meth:`convert_line`, except that the first
+        element of the returned |tuple| is the compiled regex
+        instead of the pattern |str|. Results are cached.
 
-        return pattern, group_id
+        """
+        _check_line_type(line)
+        return _compile_line(line, capture_groups, group_id)
 
     @staticmethod
     def generate_captures(m):
@@ -355,3 +292,149 @@ class Parser:
         """Perform instantiation-time stuff."""
         # Check pattern viability *now*
         self.pattern(capture_sections=False)
+
+
+# Regex fragments for assembling line patterns
+_p_line_start = r"(^|(?<=\n))"
+_p_opt_ws = r"[ \t]*"
+_p_req_ws = r"[ \t]+"
+_p_line_end = "($|(?=\n))"
+
+#: Characters calling for full shell-style lexing of a pattern line
+_shlex_chars = "\"'\\"
+
+#: Regex matching a run of characters that ``shlex`` would not split on
+_rx_shlex_word = re.compile(r"[^ \t\r\n]+")
+
+
+def _check_line_type(line):
+    """Raise :exc:`TypeError` if `line` is not a |str|.
+
+    Checked up front, before `line` reaches the caches or the
+    token splitter, so that every bad input fails the same way.
+
+    """
+    if not isinstance(line, str):
+        raise TypeError(
+            "Line must be str, not '{0}'".format(type(line).__name__)
+        )
+
+
+def _split_tokens(line):
+    """Split a line of the mini-language into token strings.
+
+    Lines without any quotes or escapes are split directly; only
+    lines containing them go through :func:`shlex.split`, which
+    gives the same result in the simple case but much more slowly.
+
+    `line` must already be known to be a |str|; see
+    :func:`_check_line_type`.
+
+    """
+    if any(c in line for c in _shlex_chars):
+        return shlex.split(line)
+    else:
+        return _rx_shlex_word.findall(line)
+
+
+@functools.lru_cache(maxsize=1024)
+def _convert_line(line, capture_groups, group_id):
+    """Perform the (cached) work of :meth:`Parser.convert_line`."""
+    # Parse line into tokens. The cached parse info for each carries
+    # everything needed here, so no Token instances are created.
+    tokens = _split_tokens(line)
+    i_last = len(tokens) - 1
+
+    # Zero-length start of line (or of entire string) match,
+    # and then always have optional starting whitespace.
+    # If the line turns out to be optional, the opening paren
+    # is inserted between these two.
+    parts = [_p_line_start, _p_opt_ws]
+
+    # Initialize flag for a preceding no-space-after num token
+    prior_no_space_token = False
+
+    # Initialize flag for whether the line is optional
+    optional_line = False
+
+    for i, tok in enumerate(tokens):
+        t = _token_info(tok, capture_groups)
+
+        tok_pattern = t.pattern
+
+        if t.is_optional_line:
+            if i == 0:
+                optional_line = True
+                continue
+            else:
+                raise LineError(line)
+
+        if t.is_any:
+            parts.append(tok_pattern)
+            prior_no_space_token = False
+
+        else:
+            if not prior_no_space_token:
+                tok_pattern = std_wordify_open(tok_pattern)
+
+            if t.space_after is SpaceAfter.Required:
+                tok_pattern = std_wordify_close(tok_pattern)
+                prior_no_space_token = False
+            else:
+                prior_no_space_token = True
+
+            parts.append(tok_pattern)
+
+        # Add required space, optional space, or no space, depending
+        # on what the token calls for, as long as it's not
+        # the last token
+        if i < i_last:
+            if t.space_after is SpaceAfter.Required:
+                parts.append(_p_req_ws)
+            elif t.space_after is SpaceAfter.Optional:
+                parts.append(_p_opt_ws)
+
+    # Always put possible whitespace to the end of the line.
+    parts.append(_p_opt_ws)
+
+    # Wrap pattern with parens and '?' if it's optional.
+    #
+    # The leading question mark in the opening paren is
+    # to make the SOL/SOF lookbehind optional in the case of
+    # an optional line, per #89.
+    if optional_line:
+        parts.insert(1, "?(")
+        parts.append(")?")
+
+    # Per #89, this lookahead must also be optional for an
+    # optional line
+    parts.append(_p_line_end + ("?" if optional_line else ""))
+
+    pattern = "".join(parts)
+
+    # Without capture groups there are no placeholders, and
+    # the group ID passes through untouched
+    if not capture_groups:
+        return pattern, group_id
+
+    # Number the capture groups all at once. Each capturing token
+    # contributes exactly one group ID placeholder, in order, so
+    # splitting on it and interleaving the running IDs does the job.
+    pieces = pattern.split(Token._s_group_id)
+    n_groups = len(pieces) - 1
+
+    if n_groups:
+        ids = map(str, range(group_id, group_id + n_groups))
+        pattern = (
+            "".join(itt.chain.from_iterable(zip(pieces, ids))) + pieces[-1]
+        )
+        group_id += n_groups
+
+    return pattern, group_id
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_line(line, capture_groups, group_id):
+    """Perform the (cached) work of :meth:`Parser.compile_line`."""
+    pattern, group_id = _convert_line(line, capture_groups, group_id)
+    return re.compile(pattern), group_id
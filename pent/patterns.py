@@ -59,19 +59,24 @@ def wordify_pattern(p, word_chars):
     return wordify_open(wordify_close(p, word_chars), word_chars)
 
 
+_p_std_word_open = r"(?<![{0}])".format(std_word_chars)
+
+_p_std_word_close = r"(?![{0}])".format(std_word_chars)
+
+
 def std_wordify(p):
     """Wrap a token in the ``pent`` standard word start/end markers."""
-    return wordify_pattern(p, std_word_chars)
+    return _p_std_word_open + p + _p_std_word_close
 
 
 def std_wordify_open(p):
     """Prepend the standard word start markers."""
-    return r"(?<![{0}]){1}".format(std_word_chars, p)
+    return _p_std_word_open + p
 
 
 def std_wordify_close(p):
     """Append the standard word end markers."""
-    return r"{1}(?![{0}])".format(std_word_chars, p)
+    return p + _p_std_word_close
 
 
 _p_intnums = r"\d+"
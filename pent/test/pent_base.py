@@ -32,6 +32,7 @@ import itertools as itt
 from pathlib import Path
 import re
 from textwrap import dedent
+import time
 import unittest as ut
 
 import pent
@@ -39,30 +40,83 @@ from pent import ParserField
 from pent.errors import LineError
 from pent.thrulist import ThruList
 
+from .testdata import number_sign_vals
+
 
 # HELPERS
 testdir_path = Path() / "pent" / "test"
 
+#: All (Number, Sign) combinations, in the standard order
+_NUMBER_SIGN = tuple(itt.product(pent.Number, pent.Sign))
+
 
 class SuperPent:
     """Superclass of various test classes, with common methods."""
 
-    import pent
-
     prs = pent.Parser(body="")
 
+    #: Test values paired with their expected matches for each
+    #: (Number, Sign) combination
+    _vals_items = tuple(number_sign_vals.items())
+
+    #: Names of the first several capture groups in converted patterns
+    _grp = tuple(pent.Token.group_prefix + str(i) for i in range(8))
+
     @staticmethod
     def does_parse_match(re_pat, s):
-        """Run match-or-not test on `s` using regex pattern `re_pat`."""
-        m = re.search(re_pat, s)
+        """Run match-or-not test on `s` using regex pattern `re_pat`.
+
+        `re_pat` may be either a pattern string or a compiled regex.
+
+        """
+        if hasattr(re_pat, "search"):
+            m = re_pat.search(s)
+        else:
+            m = re.search(re_pat, s)
 
         return m is not None
 
+    def compile_ns_lines(self, pat_template):
+        """Compile `pat_template` for every (Number, Sign) combination.
+
+        `pat_template` takes the sign and number characters as its
+        two format fields. Returns a list of (n, s, regex) tuples.
+
+        """
+        ns_compiled = []
+
+        for n, s in _NUMBER_SIGN:
+            test_pat = pat_template.format(s.value, n.value)
+            ns_compiled.append((n, s, self.prs.compile_line(test_pat)[0]))
+
+        return ns_compiled
+
+    def assertNoGroup(self, m, name):
+        """Assert that match `m` has no group named `name`."""
+        try:
+            m.group(name)
+        except IndexError:
+            return
+
+        self.fail("Group '{0}' unexpectedly present".format(name))
+
     @staticmethod
     def make_testname(v, n, s):
         """Compose test name from a numerical value and pattern Number/Sign."""
         return "{0}_{1}_{2}".format(v, n, s)
 
+    def fail_on_mismatches(self, failures):
+        """Fail the test if any mismatches were collected in `failures`.
+
+        Only the first several mismatches are included in the message.
+
+        """
+        if failures:
+            self.fail(
+                "{0} mismatches:\n".format(len(failures))
+                + "\n".join(failures[:20])
+            )
+
     @staticmethod
     def get_file(fname):
         """Return the contents of the given file."""
@@ -81,14 +135,10 @@ class TestPentTokens(ut.TestCase, SuperPent):
 
     def test_arbitrary_bad_token(self):
         """Confirm bad tokens raise errors."""
-        import pent
-
         self.assertRaises(pent.TokenError, pent.Token, "abcd")
 
     def test_group_enclosures(self):
         """Ensure 'ignore' flag is properly set."""
-        import pent
-
         testname_fmt = "{0}_{1}"
         token_fmt = {
             pent.Content.Any: "~{0}",
@@ -107,8 +157,6 @@ class TestPentTokens(ut.TestCase, SuperPent):
 
     def test_number_property(self):
         """Ensure t.number properties return correct values."""
-        import pent
-
         from .testdata import number_patterns as npats
 
         for p in npats.values():
@@ -124,8 +172,6 @@ class TestPentTokens(ut.TestCase, SuperPent):
 
     def test_sign_property(self):
         """Ensure t.sign properties return correct values."""
-        import pent
-
         from .testdata import number_patterns as npats
 
         for p in npats.values():
@@ -141,11 +187,33 @@ class TestPentTokens(ut.TestCase, SuperPent):
 
     def test_qty_property_on_any_and_optline(self):
         """Ensure t.match_quantity property returns correct value on 'any'."""
-        import pent
-
         self.assertEqual(pent.Token("~").match_quantity, None)
         self.assertEqual(pent.Token("?").match_quantity, None)
 
+    def test_parse_info_shared(self):
+        """Confirm repeated tokens reuse the cached parse information."""
+        with self.subTest("same_capture"):
+            self.assertIs(pent.Token("#!..i")._info, pent.Token("#!..i")._info)
+
+        with self.subTest("different_capture"):
+            t_cap = pent.Token("#!..i")
+            t_nocap = pent.Token("#!..i", do_capture=False)
+            self.assertIsNot(t_cap._info, t_nocap._info)
+            self.assertTrue(t_cap.needs_group_id)
+            self.assertFalse(t_nocap.needs_group_id)
+
+    def test_grammar_fallback_on_stray_whitespace(self):
+        """Confirm tokens with stray whitespace still parse as before."""
+        for tok, ref in (
+            (" #!..i", "#!..i"),
+            ("#!..i ", "#!..i"),
+            ("@!. foo", "@!.foo"),
+        ):
+            with self.subTest(tok):
+                self.assertEqual(
+                    pent.Token(tok).pattern, pent.Token(ref).pattern
+                )
+
 
 class TestPentThruList(ut.TestCase, SuperPent):
     """Direct tests of the custom pass-thru list."""
@@ -199,58 +267,85 @@ class TestPentCorePatterns(ut.TestCase, SuperPent):
 
     def test_number_and_sign_matching(self):
         """Confirm number and sign patterns match the right string patterns."""
-        import pent
+        # Each pattern sits in its own optional lookahead, so a single
+        # match reports every (Number, Sign) pattern found in the value.
+        # A plain alternation would only report the first one to match.
+        ns_names = {}
+        parts = []
+
+        for i, (n, s) in enumerate(_NUMBER_SIGN):
+            grp = "ns_{0}".format(i)
+            ns_names[grp] = (n, s)
+            parts.append(
+                "(?=(?:.*?(?P<{0}>{1}))?)".format(
+                    grp, pent.std_wordify(pent.number_patterns[n, s])
+                )
+            )
+
+        ns_rx = re.compile("".join(parts), re.S)
 
-        from .testdata import number_sign_vals as vals
+        failures = []
 
-        for (v, n, s) in itt.product(vals, pent.Number, pent.Sign):
-            with self.subTest(self.make_testname(v, n, s)):
-                npat = pent.number_patterns[(n, s)]
-                npat = pent.std_wordify(npat)
+        for v, v_map in self._vals_items:
+            matched = {
+                ns_names[grp]
+                for grp, val in ns_rx.match(v).groupdict().items()
+                if val is not None
+            }
 
-                res = self.does_parse_match(npat, v)
+            for n, s in ns_names.values():
+                if v_map[n, s] != ((n, s) in matched):
+                    failures.append(self.make_testname(v, n, s) + ": " + v)
 
-                self.assertEqual(vals[v][(n, s)], res, msg=npat)
+        self.fail_on_mismatches(failures)
 
     def test_raw_single_value_space_delimited(self):
         """Confirm single-value parsing from a line works with raw patterns."""
-        import pent
+        test_line = "This line contains the value {} with space delimit."
 
-        from .testdata import number_sign_vals as vals
+        ns_compiled = [
+            (n, s, re.compile(pent.std_wordify(pent.number_patterns[n, s])))
+            for n, s in _NUMBER_SIGN
+        ]
 
-        test_line = "This line contains the value {} with space delimit."
+        failures = []
 
-        for v in vals:
+        for v, v_map in self._vals_items:
             test_str = test_line.format(v)
 
-            for (n, s) in itt.product(pent.Number, pent.Sign):
-                with self.subTest(self.make_testname(v, n, s)):
-                    npat = pent.number_patterns[(n, s)]
-                    npat = pent.std_wordify(npat)
-
-                    res = self.does_parse_match(npat, test_str)
+            for n, s, rx in ns_compiled:
+                if v_map[n, s] != self.does_parse_match(rx, test_str):
+                    failures.append(
+                        self.make_testname(v, n, s) + ": " + test_str
+                    )
 
-                    self.assertEqual(vals[v][(n, s)], res, msg=test_str)
+        self.fail_on_mismatches(failures)
 
 
 class TestPentParserPatterns(ut.TestCase, SuperPent):
     """Confirming pattern matching of patterns generated by the Parser."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Assemble and compile the manual two-line regex once."""
+        cp_1 = cls.prs.convert_line("~ @!.one: #!.+i")[0]
+        cp_2 = cls.prs.convert_line("~ @!.two: #!.-s", group_id=2)[0]
+
+        cls._two_line_re = re.compile(cp_1 + r"\n" + cp_2)
+
     def test_empty_pattern_matches_blank_line(self):
         """Confirm an empty pattern matches only a blank line."""
-        self.assertIsNotNone(re.search(self.prs.pattern(), ""))
-        self.assertIsNone(re.search(self.prs.pattern(), "3"))
+        rx = re.compile(self.prs.pattern())
+
+        self.assertIsNotNone(rx.search(""))
+        self.assertIsNone(rx.search("3"))
 
     def test_token_error_raised_at_init(self):
         """Ensure TokenError raised at instantiation w/bad token."""
-        import pent
-
         self.assertRaises(pent.TokenError, pent.Parser, body="abcd")
 
     def test_group_tags_or_not(self):
         """Confirm group tags are added when needed; omitted when not."""
-        import pent
-
         patterns = {
             pent.Content.Any: "~{}",
             pent.Content.String: "@{}.this",
@@ -274,30 +369,26 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
         Also tests the 'suppress' number mode.
 
         """
-        import pent
-
-        from .testdata import number_sign_vals as vals
-
         test_line = "This line contains the value {} with space delimit."
         test_pat_template = "~ @!.contains ~! #!.{0}{1} ~"
 
-        for v in vals:
-            test_str = test_line.format(v)
+        ns_compiled = self.compile_ns_lines(test_pat_template)
 
-            for (n, s) in itt.product(pent.Number, pent.Sign):
-                test_pat = test_pat_template.format(s.value, n.value)
+        failures = []
 
-                with self.subTest(self.make_testname(v, n, s)):
-                    npat = self.prs.convert_line(test_pat)[0]
+        for v, v_map in self._vals_items:
+            test_str = test_line.format(v)
 
-                    res = self.does_parse_match(npat, test_str)
+            for n, s, rx in ns_compiled:
+                if v_map[n, s] != self.does_parse_match(rx, test_str):
+                    failures.append(
+                        self.make_testname(v, n, s) + ": " + test_str
+                    )
 
-                    self.assertEqual(vals[v][n, s], res, msg=test_str)
+        self.fail_on_mismatches(failures)
 
     def test_string_capture(self):
         """Confirm string capture works when desired; is ignored when not."""
-        import pent
-
         test_line = "This is a string with a word and [symbol] in it."
         test_pat_capture = "~ @!.word ~"
         test_pat_ignore = "~ @.word ~"
@@ -305,39 +396,42 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
         test_pat_with_space = "~ '@!.string with' ~"
 
         with self.subTest("capture"):
-            pat = self.prs.convert_line(test_pat_capture)[0]
-            m = re.search(pat, test_line)
+            m = self.prs.compile_line(test_pat_capture)[0].search(test_line)
             self.assertIsNotNone(m)
-            self.assertEqual(m.group(pent.Token.group_prefix + "0"), "word")
+            self.assertEqual(m.group(self._grp[0]), "word")
 
         with self.subTest("ignore"):
-            pat = self.prs.convert_line(test_pat_ignore)[0]
-            m = re.search(pat, test_line)
+            m = self.prs.compile_line(test_pat_ignore)[0].search(test_line)
             self.assertIsNotNone(m)
-            self.assertRaises(
-                IndexError, m.group, pent.Token.group_prefix + "0"
-            )
+            self.assertNoGroup(m, self._grp[0])
 
         with self.subTest("symbol"):
-            pat = self.prs.convert_line(test_pat_symbol)[0]
-            m = re.search(pat, test_line)
+            m = self.prs.compile_line(test_pat_symbol)[0].search(test_line)
             self.assertIsNotNone(m)
-            self.assertEqual(
-                m.group(pent.Token.group_prefix + "0"), "[symbol]"
-            )
+            self.assertEqual(m.group(self._grp[0]), "[symbol]")
 
         with self.subTest("with_space"):
-            pat = self.prs.convert_line(test_pat_with_space)[0]
-            m = re.search(pat, test_line)
+            m = self.prs.compile_line(test_pat_with_space)[0].search(test_line)
             self.assertIsNotNone(m)
-            self.assertEqual(
-                m.group(pent.Token.group_prefix + "0"), "string with"
-            )
+            self.assertEqual(m.group(self._grp[0]), "string with")
+
+    def test_string_capture_with_braces(self):
+        """Confirm literal braces survive group ID substitution."""
+        test_line = "This has {0} and {braces} in it."
+
+        for cap in (True, False):
+            with self.subTest("capture" if cap else "ignore"):
+                rx = self.prs.compile_line(
+                    "~ @.{0} @.and @!.{braces} ~", capture_groups=cap
+                )[0]
+                m = rx.search(test_line)
+                self.assertIsNotNone(m)
+
+                if cap:
+                    self.assertEqual(m.group(self._grp[0]), "{braces}")
 
     def test_misc_token_matches_various(self):
         """Confirm scope of misc token matching."""
-        import pent
-
         vals = ["Cu", "43/yfd", "foo", "355.57"]
         bads = ["foo bar", "baz 456", "quux\t2e5"]
 
@@ -349,48 +443,36 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
             test_line = test_str.format(v)
 
             with self.subTest("ok_" + v):
-                pat = self.prs.convert_line(test_pat)[0]
-                m = re.search(pat, test_line)
+                m = self.prs.compile_line(test_pat)[0].search(test_line)
                 self.assertIsNotNone(m)
-                self.assertEqual(m.group(pent.Token.group_prefix + "0"), v)
+                self.assertEqual(m.group(self._grp[0]), v)
 
         for v in bads:
             test_line = test_str.format(v)
 
             with self.subTest("bad_" + v):
-                pat = self.prs.convert_line(test_pat)[0]
-                m = re.search(pat, test_line)
+                m = self.prs.compile_line(test_pat)[0].search(test_line)
                 self.assertIsNotNone(m)
-                self.assertNotEqual(m.group(pent.Token.group_prefix + "0"), v)
+                self.assertNotEqual(m.group(self._grp[0]), v)
 
     def test_single_num_capture(self):
         """Confirm single-number capture works."""
-        import pent
-
-        from .testdata import number_sign_vals as vals
-
         test_line = "This is a string with {} in it."
         test_pat_template = "~ #!.{0}{1} ~"
 
-        for v in vals:
-            test_str = test_line.format(v)
+        ns_compiled = self.compile_ns_lines(test_pat_template)
 
-            for (n, s) in itt.product(pent.Number, pent.Sign):
-                test_pat = test_pat_template.format(s.value, n.value)
-
-                with self.subTest(self.make_testname(v, n, s)):
-                    npat = self.prs.convert_line(test_pat)[0]
+        for v, v_map in self._vals_items:
+            test_str = test_line.format(v)
 
-                    m = re.search(npat, test_str)
+            for n, s, rx in ns_compiled:
+                with self.subTest(v=v, n=n, s=s):
+                    m = rx.search(test_str)
 
-                    self.assertEqual(
-                        vals[v][n, s], m is not None, msg=test_str
-                    )
+                    self.assertEqual(v_map[n, s], m is not None, msg=test_str)
 
                     if m is not None:
-                        self.assertEqual(
-                            m.group(pent.Token.group_prefix + "0"), v
-                        )
+                        self.assertEqual(m.group(self._grp[0]), v)
 
     def test_single_nums_no_space(self):
         """Confirm two-number capture works, with no intervening space.
@@ -399,84 +481,56 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
         no-space-before check.
 
         """
-        import pent
-
         test_str = "This is a string with 123-456 in it."
         test_pat = "~ #x!.+i #!.-i ~"
 
-        npat = self.prs.convert_line(test_pat)[0]
-
-        m = re.search(npat, test_str)
+        m = self.prs.compile_line(test_pat)[0].search(test_str)
 
         self.assertIsNotNone(m)
-        self.assertEqual(m.group(pent.Token.group_prefix + "0"), "123")
-        self.assertEqual(m.group(pent.Token.group_prefix + "1"), "-456")
+        self.assertEqual(m.group(self._grp[0]), "123")
+        self.assertEqual(m.group(self._grp[1]), "-456")
 
     def test_single_num_preceding_colon_capture(self):
         """Confirm single-number capture works, with preceding colon."""
-        import pent
-
-        from .testdata import number_sign_vals as vals
-
         test_line = "This is a string with :{} in it, after a colon."
         test_pat_template = "~ @x.: #!.{0}{1} ~"
 
-        for v in vals:
-            test_str = test_line.format(v)
+        ns_compiled = self.compile_ns_lines(test_pat_template)
 
-            for (n, s) in itt.product(pent.Number, pent.Sign):
-                test_pat = test_pat_template.format(s.value, n.value)
+        for v, v_map in self._vals_items:
+            test_str = test_line.format(v)
 
-                with self.subTest(self.make_testname(v, n, s)):
-                    npat = self.prs.convert_line(test_pat)[0]
+            for n, s, rx in ns_compiled:
+                with self.subTest(v=v, n=n, s=s):
+                    m = rx.search(test_str)
 
-                    m = re.search(npat, test_str)
-
-                    self.assertEqual(
-                        vals[v][n, s], m is not None, msg=test_str
-                    )
+                    self.assertEqual(v_map[n, s], m is not None, msg=test_str)
 
                     if m is not None:
-                        self.assertEqual(
-                            m.group(pent.Token.group_prefix + "0"), v
-                        )
+                        self.assertEqual(m.group(self._grp[0]), v)
 
     def test_string_and_single_num_capture(self):
         """Confirm multiple capture of string and single number."""
-        import pent
-
-        from .testdata import number_sign_vals as vals
-
         test_line = "This is a string with {} in it."
         test_pat_template = "~ @!.string ~ #!.{0}{1} ~"
 
-        for v in vals:
-            test_str = test_line.format(v)
-
-            for (n, s) in itt.product(pent.Number, pent.Sign):
-                test_pat = test_pat_template.format(s.value, n.value)
+        ns_compiled = self.compile_ns_lines(test_pat_template)
 
-                with self.subTest(self.make_testname(v, n, s)):
-                    npat = self.prs.convert_line(test_pat)[0]
+        for v, v_map in self._vals_items:
+            test_str = test_line.format(v)
 
-                    m = re.search(npat, test_str)
+            for n, s, rx in ns_compiled:
+                with self.subTest(v=v, n=n, s=s):
+                    m = rx.search(test_str)
 
-                    self.assertEqual(
-                        vals[v][n, s], m is not None, msg=test_str
-                    )
+                    self.assertEqual(v_map[n, s], m is not None, msg=test_str)
 
                     if m is not None:
-                        self.assertEqual(
-                            m.group(pent.Token.group_prefix + "0"), "string"
-                        )
-                        self.assertEqual(
-                            m.group(pent.Token.group_prefix + "1"), v
-                        )
+                        self.assertEqual(m.group(self._grp[0]), "string")
+                        self.assertEqual(m.group(self._grp[1]), v)
 
     def test_number_ending_sentence(self):
         """Check that a number at the end of a sentence matches correctly."""
-        import pent
-
         from .testdata import number_patterns as npats
 
         test_line = "This sentence ends with a number {}."
@@ -489,176 +543,163 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
                 pent.Quantity.Single,
             )
             with self.subTest(token):
-                pat = self.prs.convert_line(test_pat.format(token))[0]
-                m = re.search(pat, test_line.format(n))
+                m = self.prs.compile_line(test_pat.format(token))[0].search(
+                    test_line.format(n)
+                )
 
                 self.assertIsNotNone(m, msg=test_line.format(n) + token)
-                self.assertEqual(n, m.group(pent.Token.group_prefix + "0"))
+                self.assertEqual(n, m.group(self._grp[0]))
 
     def test_match_entire_line(self):
         """Confirm the tilde works to match an entire line."""
-        import pent
-
         test_line = "This is a line with whatever weird (*#$(*&23646{}}{#$"
 
         with self.subTest("capture"):
-            pat = self.prs.convert_line("~!")[0]
+            pat = self.prs.compile_line("~!")[0]
             self.assertTrue(self.does_parse_match(pat, test_line))
 
-            m = re.search(pat, test_line)
-            self.assertEqual(test_line, m.group(pent.Token.group_prefix + "0"))
+            m = pat.search(test_line)
+            self.assertEqual(test_line, m.group(self._grp[0]))
 
         with self.subTest("no_capture"):
-            pat = self.prs.convert_line("~")[0]
+            pat = self.prs.compile_line("~")[0]
             self.assertTrue(self.does_parse_match(pat, test_line))
 
-            m = re.search(pat, test_line)
-            self.assertRaises(
-                IndexError, m.group, pent.Token.group_prefix + "0"
-            )
+            m = pat.search(test_line)
+            self.assertNoGroup(m, self._grp[0])
 
     def test_any_token_capture_ranges(self):
         """Confirm 'any' captures work as expected with other tokens."""
-        import pent
-
         test_line_start = "This is a line "
         test_line_end = " with a number in brackets in the middle."
         test_num = "2e-4"
         test_line = test_line_start + "[" + test_num + "]" + test_line_end
 
-        pat = self.prs.convert_line("~! @x.[ #x!..g @x.] ~!")[0]
-        m = re.search(pat, test_line)
-
-        self.assertEqual(
-            m.group(pent.Token.group_prefix + "0"), test_line_start
+        m = self.prs.compile_line("~! @x.[ #x!..g @x.] ~!")[0].search(
+            test_line
         )
-        self.assertEqual(m.group(pent.Token.group_prefix + "1"), test_num)
-        self.assertEqual(m.group(pent.Token.group_prefix + "2"), test_line_end)
+
+        self.assertEqual(m.group(self._grp[0]), test_line_start)
+        self.assertEqual(m.group(self._grp[1]), test_num)
+        self.assertEqual(m.group(self._grp[2]), test_line_end)
 
     def test_one_or_more_str_nospace(self):
         """Confirm one-or-more str token works as expected w/no space."""
-        import pent
-
         test_string = "This is a test {} string."
         test_pat = "~ @{}+foo ~"
 
         for qty, cap in itt.product((1, 2, 3), (True, False)):
             with self.subTest("Qty: {0}, Cap: {1}".format(qty, cap)):
                 pat = test_pat.format(pent.Token._s_capture if cap else "")
-                pat = self.prs.convert_line(pat)[0]
-
                 work_str = test_string.format("foo" * qty)
 
-                m = re.search(pat, work_str)
+                m = self.prs.compile_line(pat)[0].search(work_str)
 
                 self.assertIsNotNone(m)
                 if cap:
-                    self.assertEqual(
-                        "foo" * qty, m.group(pent.Token.group_prefix + "0")
-                    )
+                    self.assertEqual("foo" * qty, m.group(self._grp[0]))
                 else:
-                    self.assertRaises(
-                        IndexError, m.group, pent.Token.group_prefix + "0"
-                    )
+                    self.assertNoGroup(m, self._grp[0])
 
     def test_one_or_more_str_with_space(self):
         """Confirm one-or-more str token works as expected w/space."""
-        import pent
-
         test_string = "This is a test {}string."
         test_pat = "~ '@x{}+foo ' ~"
 
         for qty, cap in itt.product((1, 2, 3), (True, False)):
             with self.subTest("Qty: {0}, Cap: {1}".format(qty, cap)):
                 pat = test_pat.format(pent.Token._s_capture if cap else "")
-                pat = self.prs.convert_line(pat)[0]
-
                 work_str = test_string.format("foo " * qty)
 
-                m = re.search(pat, work_str)
+                m = self.prs.compile_line(pat)[0].search(work_str)
 
                 self.assertIsNotNone(m)
                 if cap:
-                    self.assertEqual(
-                        "foo " * qty, m.group(pent.Token.group_prefix + "0")
-                    )
+                    self.assertEqual("foo " * qty, m.group(self._grp[0]))
                 else:
-                    self.assertRaises(
-                        IndexError, m.group, pent.Token.group_prefix + "0"
-                    )
+                    self.assertNoGroup(m, self._grp[0])
+
+    def test_no_redos_on_one_or_more_str(self):
+        """Confirm one-or-more str patterns finish fast on long repeats."""
+        test_pats = {"nospace": "~ @!+foo ~", "with_space": "~ '@x!+foo ' ~"}
+        test_strs = {
+            "nospace": "This is a test " + "foo" * 10000 + "X string.",
+            "with_space": "This is a test " + "foo " * 10000 + "Xstring.",
+        }
+
+        # Expected capture, or None if there should be no match
+        expect = {"nospace": None, "with_space": "foo " * 10000}
+
+        for k, pat in test_pats.items():
+            with self.subTest(k):
+                rx = self.prs.compile_line(pat)[0]
+
+                t_start = time.perf_counter()
+                m = rx.search(test_strs[k])
+                t_elapsed = time.perf_counter() - t_start
+
+                # Generous bound; a catastrophic-backtracking regression
+                # takes orders of magnitude longer than this
+                self.assertLess(t_elapsed, 1.0)
+
+                if expect[k] is None:
+                    self.assertIsNone(m)
+                else:
+                    self.assertIsNotNone(m)
+                    self.assertEqual(m.group(self._grp[0]), expect[k])
 
     @ut.skip("Not implementing optional/zero-or-more tokens")
     def test_optional_str(self):
         """Confirm single optional str token works as expected."""
-        import pent
-
         test_string = "This is a test {} string."
         test_pat = "~ @.test @{}?foo @x.string ~"
 
         for there, cap in itt.product(*itt.repeat((True, False), 2)):
             with self.subTest("There: {0}, Cap: {1}".format(there, cap)):
                 pat = test_pat.format(pent.Token._s_capture if cap else "")
-                prs_pat = self.prs.convert_line(pat)[0]
-
                 work_str = test_string.format("foo" if there else "")
 
-                m = re.search(prs_pat, work_str)
+                m = self.prs.compile_line(pat)[0].search(work_str)
 
                 self.assertIsNotNone(m)
                 if cap:
                     if there:
                         self.assertEqual(
-                            "foo",
-                            m.group(pent.Token.group_prefix + "0"),
-                            msg=work_str + pat,
+                            "foo", m.group(self._grp[0]), msg=work_str + pat
                         )
                     else:
-                        self.assertEqual(
-                            "", m.group(pent.Token.group_prefix + "0")
-                        )
+                        self.assertEqual("", m.group(self._grp[0]))
                 else:
-                    self.assertRaises(
-                        IndexError, m.group, pent.Token.group_prefix + "0"
-                    )
+                    self.assertNoGroup(m, self._grp[0])
 
     @ut.skip("Not implementing optional/zero-or-more tokens")
     def test_zero_or_more_str(self):
         """Confirm zero-or-more str token works as expected."""
-        import pent
-
         test_string = "This is a test {}string."
         test_pat = "~ @{}*foo ~"
 
         for qty, cap in itt.product((0, 1, 2, 3), (True, False)):
             with self.subTest("Qty: {0}, Cap: {1}".format(qty, cap)):
                 pat = test_pat.format(pent.Token._s_capture if cap else "")
-                pat = self.prs.convert_line(pat)[0]
-
                 work_str = test_string.format("foo " * qty)
 
-                m = re.search(pat, work_str)
+                m = self.prs.compile_line(pat)[0].search(work_str)
 
                 self.assertIsNotNone(m)
                 if cap:
-                    self.assertEqual(
-                        "foo " * qty, m.group(pent.Token.group_prefix + "0")
-                    )
+                    self.assertEqual("foo " * qty, m.group(self._grp[0]))
                 else:
-                    self.assertRaises(
-                        IndexError, m.group, pent.Token.group_prefix + "0"
-                    )
+                    self.assertNoGroup(m, self._grp[0])
 
     @ut.skip("Not implementing optional/zero-or-more tokens")
     def test_one_or_more_doesnt_match_zero_reps(self):
         """Confirm one-or-more str doesn't match if string isn't there."""
-        import pent
-
         test_string = "This is  a test string."
         test_pat = "~ @.is @!?absolutely @.a ~"
 
-        m = re.search(self.prs.convert_line(test_pat)[0], test_string)
+        m = self.prs.compile_line(test_pat)[0].search(test_string)
 
-        self.assertEqual("", m.group(pent.Token.group_prefix + "0"))
+        self.assertEqual("", m.group(self._grp[0]))
 
     def test_optional_pattern_syntax(self):
         """Confirm optional-line flag is only accepted as first token."""
@@ -674,8 +715,6 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
 
     def test_optional_single_line_tail(self):
         """Confirm optional-line parsing works."""
-        import pent
-
         from .testdata import opt_1line_tail_data as data
         from .testdata import opt_1line_tail_expect_block as expect_block
         from .testdata import opt_1line_tail_expect_struct as expect_struct
@@ -701,10 +740,18 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
 
                 self.assertEqual(res_struct, e)
 
+    def test_section_error_on_malformed_iterable(self):
+        """Confirm SectionError raised for an iterable of non-str lines."""
+        self.assertRaises(pent.SectionError, pent.Parser, body=[["~"]])
+
+    def test_section_error_on_non_str_lines(self):
+        """Confirm SectionError raised for sections with non-str lines."""
+        for body in ([5], b"~", ["#..i", 3.2]):
+            with self.subTest(repr(body)):
+                self.assertRaises(pent.SectionError, pent.Parser, body=body)
+
     def test_body_cleared_after_init(self):
         """Confirm correct error raised if 'body' is reset to None."""
-        import pent
-
         prs = pent.Parser(body="#..i")
 
         prs.body = None
@@ -713,28 +760,34 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
 
     def test_manual_two_lines(self):
         """Run manual check on concatenating two single-line regexes."""
-        import pent
-
         test_str = "This is line one: 12345  \nAnd this is line two: -3e-5"
 
-        test_pat_1 = "~ @!.one: #!.+i"
-        test_pat_2 = "~ @!.two: #!.-s"
+        m = self._two_line_re.search(test_str)
 
-        cp_1 = self.prs.convert_line(test_pat_1)[0]
-        cp_2 = self.prs.convert_line(test_pat_2, group_id=2)[0]
+        self.assertIsNotNone(m)
+        self.assertEqual("one:", m.group(self._grp[0]))
+        self.assertEqual("12345", m.group(self._grp[1]))
+        self.assertEqual("two:", m.group(self._grp[2]))
+        self.assertEqual("-3e-5", m.group(self._grp[3]))
+
+    def test_compile_line(self):
+        """Confirm compiled line regex matches the converted pattern."""
+        test_str = "This is line two: -3e-5"
+        test_pat = "~ @!.two: #!.-s"
 
-        m = re.search(cp_1 + r"\n" + cp_2, test_str)
+        pat, id_pat = self.prs.convert_line(test_pat, group_id=2)
+        rx, id_rx = self.prs.compile_line(test_pat, group_id=2)
 
+        self.assertEqual(pat, rx.pattern)
+        self.assertEqual(id_pat, id_rx)
+        self.assertIs(rx, self.prs.compile_line(test_pat, group_id=2)[0])
+
+        m = rx.search(test_str)
         self.assertIsNotNone(m)
-        self.assertEqual("one:", m.group(pent.Token.group_prefix + "0"))
-        self.assertEqual("12345", m.group(pent.Token.group_prefix + "1"))
-        self.assertEqual("two:", m.group(pent.Token.group_prefix + "2"))
-        self.assertEqual("-3e-5", m.group(pent.Token.group_prefix + "3"))
+        self.assertEqual("-3e-5", m.group(self._grp[3]))
 
     def test_quick_one_or_more_number(self):
         """Run quick check on capture of one-or-more number token."""
-        import pent
-
         numbers = "2 5 -54 3.8 -1.e-12"
 
         test_str = "This has numbers {} with end space.".format(numbers)
@@ -743,27 +796,21 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
         test_pat = "~ #!+.g ~"
         test_pat_period = "~ #x!+.g @.."
 
-        re_pat = self.prs.convert_line(test_pat)[0]
-        re_pat_period = self.prs.convert_line(test_pat_period)[0]
+        re_pat = self.prs.compile_line(test_pat)[0]
+        re_pat_period = self.prs.compile_line(test_pat_period)[0]
 
         with self.subTest("end_space"):
-            m_pat = re.search(re_pat, test_str)
+            m_pat = re_pat.search(test_str)
             self.assertIsNotNone(m_pat)
-            self.assertEqual(
-                m_pat.group(pent.Token.group_prefix + "0"), numbers
-            )
+            self.assertEqual(m_pat.group(self._grp[0]), numbers)
 
         with self.subTest("period"):
-            m_pat_period = re.search(re_pat_period, test_str_period)
+            m_pat_period = re_pat_period.search(test_str_period)
             self.assertIsNotNone(m_pat_period)
-            self.assertEqual(
-                m_pat_period.group(pent.Token.group_prefix + "0"), numbers
-            )
+            self.assertEqual(m_pat_period.group(self._grp[0]), numbers)
 
     def test_multiline_body_parser(self):
         """Confirm parsing w/multi-line body works ok."""
-        import pent
-
         result = [[["1", "2", "4"]]]
 
         text = "\n1\n\n2\n\n\n4"
@@ -777,8 +824,6 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
         """Confirm the optional-space matching works."""
         from textwrap import dedent
 
-        import pent
-
         text = dedent(
             """\
             1 2 3 4 5
@@ -799,8 +844,6 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
         """Confirm optional-space works for after numbers."""
         from textwrap import dedent
 
-        import pent
-
         text = dedent(
             """
             1 2 3 4 5
@@ -823,8 +866,6 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
         """Confirm simple multiblock parser works correctly."""
         from textwrap import dedent
 
-        import pent
-
         from .testdata import mblock_result
 
         data = dedent(
@@ -854,8 +895,6 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
         """Confirm repeated multiblock parser works correctly."""
         from textwrap import dedent
 
-        import pent
-
         from .testdata import mblock_repeated_result
 
         data = dedent(
@@ -885,8 +924,6 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
 
     def test_parsers_in_head_and_tail(self):
         """Confirm proper behavior of Parsers for head and tail."""
-        import pent
-
         data = dedent(
             """\
             HEAD 1 2
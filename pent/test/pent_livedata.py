@@ -27,17 +27,39 @@ r"""*'Live data' test objects for* ``pent`` *test suite*.
 """
 
 import itertools as itt
+import mmap
 import re
 import unittest as ut
 
 from pent import ParserField
 
-from .pent_base import SuperPent
+from .pent_base import SuperPent, testdir_path
 
 
 class TestPentORCALiveData(ut.TestCase, SuperPent):
     """Confirming ORCA output parses as expected."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Read the C2F4 .hess file and build its parsers once."""
+        import pent
+
+        cls._C2F4_hess_data = cls.get_orca_C2F4_hess()
+
+        # Trivial application of the tail, but serves to check that
+        # it works correctly.
+        cls._freq_parser = pent.Parser(
+            head=("@.$vibrational_frequencies", "#!.+i"),
+            body="#.+i #!..f",
+            tail=("~", "@.$normal_modes", "#!++i"),
+        )
+
+        cls._dipders_parser = pent.Parser(
+            head=("@.$dipole_derivatives", "#.+i"), body="#!+.f"
+        )
+
+        cls._freq_pattern_re = re.compile(cls._freq_parser.pattern())
+
     @classmethod
     def get_orca_cas_file(cls):
         """Return the sample ORCA CAS output."""
@@ -65,24 +87,12 @@ class TestPentORCALiveData(ut.TestCase, SuperPent):
 
     def test_orca_hess_freq_parser(self):
         """Confirm 1-D data parser for ORCA freqs works."""
-        import pent
-
         from .testdata import orca_hess_freqs
 
-        head_pattern = ("@.$vibrational_frequencies", "#!.+i")
-        body_pattern = "#.+i #!..f"
-
-        # Trivial application of the tail, but serves to check that
-        # it works correctly.
-        tail_pattern = ("~", "@.$normal_modes", "#!++i")
-
-        freq_parser = pent.Parser(
-            head=head_pattern, body=body_pattern, tail=tail_pattern
-        )
+        freq_parser = self._freq_parser
+        data = self._C2F4_hess_data
 
-        data = self.get_orca_C2F4_hess()
-
-        m = re.search(freq_parser.pattern(), data)
+        m = self._freq_pattern_re.search(data)
         self.assertIsNotNone(m)
         self.assertEqual(m.group(0).count("\n"), 22)
 
@@ -95,20 +105,25 @@ class TestPentORCALiveData(ut.TestCase, SuperPent):
 
         self.assertEqual(freq_parser.capture_body(data), orca_hess_freqs)
 
+    def test_orca_hess_freq_pattern_on_mmap(self):
+        """Confirm the freq parser pattern works on a memory-mapped file."""
+        rx = re.compile(self._freq_parser.pattern().encode("ascii"))
+        m_str = self._freq_pattern_re.search(self._C2F4_hess_data)
+
+        with open(str(testdir_path / "C2F4_01.hess"), "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                m = rx.search(mm)
+                self.assertIsNotNone(m)
+                self.assertEqual(m.group(0).decode("ascii"), m_str.group(0))
+
     def test_orca_hess_dipders_parser(self):
         """Confirm 2-D single-block data parser for ORCA dipders works."""
-        import pent
-
         from .testdata import orca_hess_dipders
 
-        head_pattern = ("@.$dipole_derivatives", "#.+i")
-        body_pattern = "#!+.f"
-
-        freq_parser = pent.Parser(head=head_pattern, body=body_pattern)
-
-        data = self.get_orca_C2F4_hess()
-
-        self.assertEqual(freq_parser.capture_body(data), orca_hess_dipders)
+        self.assertEqual(
+            self._dipders_parser.capture_body(self._C2F4_hess_data),
+            orca_hess_dipders,
+        )
 
     def test_orca_hess_column_stacked(self):
         """Confirm column stacking works as expected."""
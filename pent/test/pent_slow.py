@@ -28,91 +28,134 @@ r"""*SLOW test objects for* ``pent`` *test suite*.
 
 
 import itertools as itt
-import re
+import os
 import unittest as ut
 
+import pent
+
 from .pent_base import SuperPent
 
 
 class TestPentParserPatternsSlow(ut.TestCase, SuperPent):
     """SLOW tests confirming pattern matching of Parser regexes."""
 
-    def test_three_token_sequence(self):
-        """Ensure combinatorial token sequence parses correctly."""
-        import pent
+    @classmethod
+    def setUpClass(cls):
+        """Format the tokens shared by the three-token sequence tests.
+
+        If the ``PENT_FAST_TESTS`` environment variable is set (e.g., via
+        ``python tests.py -a --trim``), only the first and last values
+        of each token kind are used, for a much quicker but less
+        thorough run.
 
+        """
         from .testdata import number_patterns as nps
 
+        str_pat = {"foo": "@{0}{1}{2}foo"}
+
+        # (value, formatted token) pairs, keyed by content type and
+        # whether a space is allowed after the token
+        cls._formatted = {
+            (c, s): tuple(
+                (
+                    v,
+                    p.format(
+                        "" if s else pent.SpaceAfter.Prohibited,
+                        pent.Token._s_capture,
+                        pent.Quantity.Single,
+                    ),
+                )
+                for v, p in (
+                    str_pat if c is pent.Content.String else nps
+                ).items()
+            )
+            for c, s in itt.product(
+                (pent.Content.String, pent.Content.Number), (True, False)
+            )
+        }
+
+        if os.environ.get("PENT_FAST_TESTS"):
+            # Quick run: only the first and last value of each kind
+            cls._formatted = {
+                k: items[:1] + items[1:][-1:]
+                for k, items in cls._formatted.items()
+            }
+
+    def check_three_token_sequence(self, c1, c2):
+        """Check combinatorial token sequences starting with `c1`, `c2`.
+
+        The sequences are split up by the content type of the first
+        two tokens so that each shard runs as its own test.
+
+        """
         pat_template = "~ {0} {1} {2} ~"
         str_template = "String! {0}{1}{2}{3}{4} More String!"
-        str_pat = {"foo": "@{0}{1}{2}foo"}
 
         testname_template = "{0}_{1}_{2}_{3}_{4}"
 
         str_or_num = (pent.Content.String, pent.Content.Number)
         t_f = (True, False)
 
-        for c1, s1, c2, s2, c3 in itt.product(
-            str_or_num, t_f, str_or_num, t_f, str_or_num
-        ):
+        failures = []
+
+        for s1, s2, c3 in itt.product(t_f, t_f, str_or_num):
             if (c1 is c2 and not s1) or (c2 is c3 and not s2):
                 # No reason to have no-space strings against one another;
                 # no-space numbers adjacent to one another make
                 # no syntactic sense.
                 continue
 
-            vals1 = str_pat if c1 == pent.Content.String else nps.keys()
-            vals2 = str_pat if c2 == pent.Content.String else nps.keys()
-            vals3 = str_pat if c3 == pent.Content.String else nps.keys()
-
-            for v1, v2, v3 in itt.product(vals1, vals2, vals3):
-                p1 = (str_pat if c1 == pent.Content.String else nps)[
-                    v1
-                ].format(
-                    pent.SpaceAfter.Prohibited if not s1 else "",
-                    pent.Token._s_capture,
-                    pent.Quantity.Single,
-                )
-                p2 = (str_pat if c2 == pent.Content.String else nps)[
-                    v2
-                ].format(
-                    pent.SpaceAfter.Prohibited if not s2 else "",
-                    pent.Token._s_capture,
-                    pent.Quantity.Single,
-                )
-                p3 = (str_pat if c3 == pent.Content.String else nps)[
-                    v3
-                ].format("", pent.Token._s_capture, pent.Quantity.Single)
-
+            for (v1, p1), (v2, p2), (v3, p3) in itt.product(
+                self._formatted[c1, s1],
+                self._formatted[c2, s2],
+                self._formatted[c3, True],
+            ):
                 test_pat = pat_template.format(p1, p2, p3)
                 test_str = str_template.format(
                     v1, " " if s1 else "", v2, " " if s2 else "", v3
                 )
 
-                with self.subTest(
-                    testname_template.format(v1, s1, v2, s2, v3)
-                ):
-                    npat = self.prs.convert_line(test_pat)[0]
-
-                    m = re.search(npat, test_str)
-
-                    self.assertIsNotNone(m, msg=test_pat)
-                    self.assertEqual(
-                        m.group(pent.Token.group_prefix + "0"),
-                        v1,
-                        msg=test_pat + " :: " + test_str,
-                    )
-                    self.assertEqual(
-                        m.group(pent.Token.group_prefix + "1"),
-                        v2,
-                        msg=test_pat + " :: " + test_str,
-                    )
-                    self.assertEqual(
-                        m.group(pent.Token.group_prefix + "2"),
-                        v3,
-                        msg=test_pat + " :: " + test_str,
+                m = self.prs.compile_line(test_pat)[0].search(test_str)
+
+                if m is None or (
+                    m.group(self._grp[0]),
+                    m.group(self._grp[1]),
+                    m.group(self._grp[2]),
+                ) != (v1, v2, v3):
+                    failures.append(
+                        testname_template.format(v1, s1, v2, s2, v3)
+                        + ": "
+                        + test_pat
+                        + " :: "
+                        + test_str
                     )
 
+        self.fail_on_mismatches(failures)
+
+    def test_three_token_sequence_str_str(self):
+        """Ensure token sequences starting string, string parse correctly."""
+        self.check_three_token_sequence(
+            pent.Content.String, pent.Content.String
+        )
+
+    def test_three_token_sequence_str_num(self):
+        """Ensure token sequences starting string, number parse correctly."""
+        self.check_three_token_sequence(
+            pent.Content.String, pent.Content.Number
+        )
+
+    def test_three_token_sequence_num_str(self):
+        """Ensure token sequences starting number, string parse correctly."""
+        self.check_three_token_sequence(
+            pent.Content.Number, pent.Content.String
+        )
+
+    def test_three_token_sequence_num_num(self):
+        """Ensure token sequences starting number, number parse correctly."""
+        self.check_three_token_sequence(
+            pent.Content.Number, pent.Content.Number
+        )
+
 
 def suite_base_slow():
     """Create and return the test suite for SLOW base tests."""
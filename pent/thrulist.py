@@ -30,6 +30,8 @@ from .errors import ThruListError
 class ThruList(list):
     """List that passes through `key` if len == 1."""
 
+    __slots__ = ()
+
     def __getitem__(self, key):
         """Return list item, or element of first item if len == 1."""
         if isinstance(key, int):
@@ -24,20 +24,51 @@ r"""*Token handling for mini-language parser for* ``pent``.
 
 """
 
+from collections import namedtuple
+import functools
+import itertools as itt
+import re
+
 import attr
-import pyparsing as pp
 
 from .enums import Number, Sign, TokenField
 from .enums import Content, Quantity, SpaceAfter
 from .errors import TokenError
 
 
+#: Container for the information derived from a parsed token string.
+#: Depends only on the token string and the capture setting, so it
+#: can safely be cached and shared among |Token| instances.
+_TokenInfo = namedtuple(
+    "_TokenInfo",
+    [
+        "pattern",
+        "needs_group_id",
+        "is_any",
+        "is_optional_line",
+        "is_str",
+        "is_misc",
+        "is_num",
+        "match_quantity",
+        "number",
+        "sign",
+        "space_after",
+        "capture",
+    ],
+)
+
+
 @attr.s(slots=True)
 class Token:
     """Encapsulates transforming mini-language patterns tokens into regex."""
 
     from .patterns import number_patterns as _numpats
 
+    # Number patterns keyed by the raw sign and number type characters
+    _numpats_by_chars = {
+        s.value + n.value: p for (n, s), p in _numpats.items()
+    }
+
     #: Mini-language token string to be parsed
     token = attr.ib()
 
@@ -47,241 +78,258 @@ class Token:
     #: Flag for whether group ID substitution needs to be done
     needs_group_id = attr.ib(default=False, init=False, repr=False)
 
-    # Internal pyparsing parse result and generated regex pattern
-    _pr = attr.ib(default=None, init=False, repr=False)
-    _pattern = attr.ib(default=None, init=False, repr=False)
+    #: Assembled regex pattern from the token, as |str|
+    pattern = attr.ib(default=None, init=False, repr=False)
 
-    # #####  pyparsing pattern internals #####
+    #: Flag for whether the token is an "any content" token
+    is_any = attr.ib(default=False, init=False, repr=False)
 
-    # ## MINOR PATTERN COMPONENTS ##
-    group_prefix = "g"
-    _s_any_flag = "~"
-    _s_capture = "!"
+    #: Flag for whether the token flags an optional line
+    is_optional_line = attr.ib(default=False, init=False, repr=False)
 
-    _pp_space_after = pp.Optional(
-        pp.Word("".join(SpaceAfter), exact=1)
-    ).setResultsName(TokenField.SpaceAfter)
-    _pp_capture = pp.Optional(pp.Literal(_s_capture)).setResultsName(
-        TokenField.Capture
-    )
-    _pp_quantity = pp.Word("".join(Quantity), exact=1).setResultsName(
-        TokenField.Quantity
-    )
+    #: Flag for whether the token matches a literal string
+    is_str = attr.ib(default=False, init=False, repr=False)
 
-    # ## OPTIONAL LINE TOKEN ##
-    _pp_optional_line = pp.Literal(Content.OptionalLine.value).setResultsName(
-        TokenField.Type
-    )
+    #: Flag for whether the token is a misc token
+    is_misc = attr.ib(default=False, init=False, repr=False)
 
-    # ## ARBITRARY CONTENT TOKEN ##
-    # Anything may be matched here, including multiple words.
-    _pp_any_flag = (
-        pp.Literal(_s_any_flag).setResultsName(TokenField.Type) + _pp_capture
-    )
+    #: Flag for whether the token matches a number
+    is_num = attr.ib(default=False, init=False, repr=False)
 
-    # ## LITERAL STRING TOKEN ##
-    # Marker for the rest of the token to be a literal string
-    _pp_str_flag = pp.Literal(Content.String.value).setResultsName(
-        TokenField.Type
-    )
+    #: Match quantity; |None| for :attr:`pent.enums.Content.Any` or
+    #: :attr:`pent.enums.Content.OptionalLine`
+    match_quantity = attr.ib(default=None, init=False, repr=False)
 
-    # Remainder of the content after the marker, spaces included
-    _pp_str_value = pp.Word(pp.printables + " ").setResultsName(TokenField.Str)
-
-    # Composite pattern for a literal string
-    _pp_string = (
-        _pp_str_flag
-        + _pp_space_after
-        + _pp_capture
-        + _pp_quantity
-        + _pp_str_value
-    )
+    #: Number format; |None| if token doesn't match a number
+    number = attr.ib(default=None, init=False, repr=False)
 
-    # ## MISC SINGLE VALUE TOKEN ##
-    # Initial marker for the 'misc' token
-    _pp_misc_flag = pp.Literal(Content.Misc.value).setResultsName(
-        TokenField.Type
-    )
+    #: Number sign; |None| if token doesn't match a number
+    sign = attr.ib(default=None, init=False, repr=False)
 
-    # Composite token pattern for the misc match
-    _pp_misc = _pp_misc_flag + _pp_space_after + _pp_capture + _pp_quantity
+    #: Enum value for handling of post-match whitespace
+    space_after = attr.ib(default=None, init=False, repr=False)
 
-    # ## NUMERICAL VALUE TOKEN ##
-    # Initial marker for a numerical value
-    _pp_num_flag = pp.Literal(Content.Number.value).setResultsName(
-        TokenField.Type
-    )
+    #: Flag for whether a regex capture group should be created
+    capture = attr.ib(default=False, init=False, repr=False)
 
-    # Marker for the sign of the value; period indicates either sign
-    _pp_num_sign = pp.Word("".join(Sign), exact=1).setResultsName(
-        TokenField.Sign
-    )
+    # Internal (cached) parse information
+    _info = attr.ib(default=None, init=False, repr=False)
 
-    # Marker for the number type to look for
-    _pp_num_type = pp.Word("".join(Number), exact=1).setResultsName(
-        TokenField.Number
-    )
+    # #####  pattern internals #####
 
-    # Composite pattern for a number
-    _pp_number = (
-        _pp_num_flag
-        + _pp_space_after
-        + _pp_capture
-        + _pp_quantity
-        + pp.Group(_pp_num_sign + _pp_num_type).setResultsName(
-            TokenField.SignNumber
+    # ## MINOR PATTERN COMPONENTS ##
+    group_prefix = "g"
+    _s_any_flag = "~"
+    _s_capture = "!"
+    _s_space_after_chars = "".join(sa.value for sa in SpaceAfter)
+    _s_quantity_chars = "".join(q.value for q in Quantity)
+    _s_sign_chars = "".join(s.value for s in Sign)
+    _s_number_chars = "".join(n.value for n in Number)
+
+    # Group ID placeholder in capturing patterns. Literal braces
+    # are always escaped, so this can't occur anywhere else.
+    _s_group_id = "{0}"
+
+    # Translation table to escape regex special characters in literals
+    _str_escapes = str.maketrans({c: "\\" + c for c in r"[\^$.|?*+(){}"})
+
+    # ## REGEX TOKEN RECOGNIZER ##
+    # Equivalent to the pyparsing grammar for every token without
+    # stray whitespace, which pyparsing would skip over. Each flag
+    # group names its type, and the conditionals restrict the
+    # trailing fields to the ones valid for that type. Group names
+    # match the TokenField values.
+    _rx_token = re.compile(
+        r"""
+        (?:
+            (?P<num_flag>{num})
+            | (?P<str_flag>{str})
+            | (?P<any_flag>{any})
+            | (?P<misc_flag>{misc})
+            | (?P<optional_line_flag>{ol})
         )
-    )
-
-    # ## COMBINED TOKEN PARSER ##
-    _pp_token = (
-        pp.StringStart()
-        + (
-            _pp_optional_line
-            ^ _pp_any_flag
-            ^ _pp_string
-            ^ _pp_number
-            ^ _pp_misc
+        (?(optional_line_flag)|
+            (?(any_flag)|(?P<space_after>[{sa}])?)
+            (?P<capture>{cap})?
+            (?(any_flag)|
+                (?P<quantity>[{qty}])
+                (?(str_flag)(?P<str>[!-~][ -~]*)|
+                    (?(num_flag)(?P<sign>[{sign}])(?P<number>[{number}]))
+                )
+            )
         )
-        + pp.StringEnd()
+        """.format(
+            ol=re.escape(Content.OptionalLine.value),
+            any=re.escape(Content.Any.value),
+            str=re.escape(Content.String.value),
+            num=re.escape(Content.Number.value),
+            misc=re.escape(Content.Misc.value),
+            sa=re.escape(_s_space_after_chars),
+            cap=re.escape(_s_capture),
+            qty=re.escape(_s_quantity_chars),
+            sign=re.escape(_s_sign_chars),
+            number=re.escape(_s_number_chars),
+        ),
+        re.X,
     )
 
-    # Informational properties
-    @property
-    def pattern(self):
-        """Return assembled regex pattern from the token, as |str|."""
-        return self._pattern
-
-    @property
-    def is_any(self):
-        """Return flag for whether the token is an "any content" token."""
-        return self._pr[TokenField.Type] == Content.Any
+    def __attrs_post_init__(self):
+        """Handle automatic creation stuff."""
+        self._info = _token_info(self.token, self.do_capture)
+
+        (
+            self.pattern,
+            self.needs_group_id,
+            self.is_any,
+            self.is_optional_line,
+            self.is_str,
+            self.is_misc,
+            self.is_num,
+            self.match_quantity,
+            self.number,
+            self.sign,
+            self.space_after,
+            self.capture,
+        ) = self._info
 
-    @property
-    def is_optional_line(self):
-        """Return flag for whether the token flags an optional line."""
-        return self._pr[TokenField.Type] == Content.OptionalLine
+    @classmethod
+    def _parse(cls, token, do_capture):
+        """Parse `token` and assemble its regex pattern.
 
-    @property
-    def is_str(self):
-        """Return flag for whether the token matches a literal string."""
-        return self._pr[TokenField.Type] == Content.String
+        Returns a :class:`_TokenInfo`. Performs no caching itself;
+        other than when building :data:`_common_token_info`, it
+        should only be reached through :func:`_token_info`.
 
-    @property
-    def is_misc(self):
-        """Return flag for whether the token is a misc token."""
-        return self._pr[TokenField.Type] == Content.Misc
+        """
+        pr = cls._fast_parse(token)
 
-    @property
-    def is_num(self):
-        """Return flag for whether the token matches a number."""
-        return self._pr[TokenField.Type] == Content.Number
+        if pr is None:
+            pr = _pp_parse(token)
 
-    @property
-    def match_quantity(self):
-        """Return match quantity.
+        # Type flags, from plain comparisons on the raw type character
+        type_char = pr[TokenField.Type]
+        is_any = type_char == Content.Any.value
+        is_optional_line = type_char == Content.OptionalLine.value
+        is_str = type_char == Content.String.value
+        is_misc = type_char == Content.Misc.value
+        is_num = type_char == Content.Number.value
 
-        |None| for :attr:`pent.enums.Content.Any` or
-        :attr:`pent.enums.Content.OptionalLine`
+        capture = TokenField.Capture in pr
 
-        """
-        if self.is_any or self.is_optional_line:
-            return None
+        if is_any or is_optional_line:
+            quantity = None
         else:
-            return Quantity(self._pr[TokenField.Quantity])
+            quantity = Quantity(pr[TokenField.Quantity])
 
-    @property
-    def number(self):
-        """#: Return number format; |None| if token doesn't match a number."""
-        if self.is_num:
-            return Number(self._pr[TokenField.SignNumber][TokenField.Number])
+        if is_num:
+            sign_char = pr[TokenField.SignNumber][TokenField.Sign]
+            number_char = pr[TokenField.SignNumber][TokenField.Number]
+            number = Number(number_char)
+            sign = Sign(sign_char)
         else:
-            return None
+            number = sign = None
 
-    @property
-    def sign(self):
-        """#: Return number sign; |None| if token doesn't match a number."""
-        if self.is_num:
-            return Sign(self._pr[TokenField.SignNumber][TokenField.Sign])
+        if is_any:
+            space_after = False
+        elif TokenField.SpaceAfter in pr:
+            space_after = SpaceAfter(pr[TokenField.SpaceAfter])
         else:
-            return None
-
-    @property
-    def space_after(self):
-        """Return Enum value for handling of post-match whitespace."""
-        if self.is_any:
-            return False
-        elif TokenField.SpaceAfter in self._pr:
-            return SpaceAfter(self._pr[TokenField.SpaceAfter])
-        else:
-            return SpaceAfter.Required
-
-    @property
-    def capture(self):
-        """Return flag for whether a regex capture group should be created."""
-        return TokenField.Capture in self._pr
-
-    def __attrs_post_init__(self):
-        """Handle automatic creation stuff."""
-        try:
-            self._pr = self._pp_token.parseString(self.token)
-        except pp.ParseException as e:
-            raise TokenError(self.token) from e
-
-        if self.is_any:
-            self._pattern, self.needs_group_id = self._selective_group_enclose(
-                ".*?"
-            )
-            return
+            space_after = SpaceAfter.Required
 
         # Only single and one-or-more captures implemented for now.
         # Optional and zero-or-more captures may actually not be feasible
-        if self.is_str:
+        if is_any:
+            pattern = ".*?"
+
+        elif is_str:
             # Always store the string pattern
-            self._pattern = self._string_pattern()
+            pattern = cls._string_pattern(pr[TokenField.Str])
 
             # Modify, depending on the Quantity
-            if self.match_quantity is Quantity.OneOrMore:
-                self._pattern = "(" + self._pattern + ")+"
+            if quantity is Quantity.OneOrMore:
+                pattern = "(" + pattern + ")+"
 
-        elif self.is_num:
-            self._pattern = self._get_number_pattern()
+        elif is_num:
+            pattern = cls._get_number_pattern(sign_char, number_char)
 
-            if self.match_quantity is Quantity.OneOrMore:
-                self._pattern += r"([ \t]+{})*".format(self._pattern)
+            if quantity is Quantity.OneOrMore:
+                pattern += r"([ \t]+{})*".format(pattern)
 
-        elif self.is_misc:
-            self._pattern = self._get_misc_pattern()
+        elif is_misc:
+            pattern = cls._get_misc_pattern()
 
-            if self.match_quantity is Quantity.OneOrMore:
-                self._pattern += r"([ \t]+{})*".format(self._pattern)
+            if quantity is Quantity.OneOrMore:
+                pattern += r"([ \t]+{})*".format(pattern)
 
-        elif self.is_optional_line:
-            pass
+        elif is_optional_line:
+            pattern = None
 
         else:  # pragma: no cover
             raise NotImplementedError(
                 "Unknown content type somehow specified!"
             )
 
-        self._pattern, self.needs_group_id = self._selective_group_enclose(
-            self._pattern
+        pattern, needs_group_id = cls._selective_group_enclose(
+            pattern, do_capture and capture
         )
 
-    def _string_pattern(self):
-        """Create a literal string pattern from the parse result."""
-        pattern = ""
+        return _TokenInfo(
+            pattern=pattern,
+            needs_group_id=needs_group_id,
+            is_any=is_any,
+            is_optional_line=is_optional_line,
+            is_str=is_str,
+            is_misc=is_misc,
+            is_num=is_num,
+            match_quantity=quantity,
+            number=number,
+            sign=sign,
+            space_after=space_after,
+            capture=capture,
+        )
 
-        for c in self._pr[TokenField.Str]:
-            if c in r"[\^$.|?*+(){}":
-                # Must escape regex special characters
-                pattern += "\\" + c
-            else:
-                pattern += c
+    @classmethod
+    def _fast_parse(cls, token):
+        """Recognize a token with the compiled regex grammar.
+
+        Returns a |dict| with the same keys that the pyparsing parse
+        result would expose, or |None| if `token` doesn't have
+        one of the simple shapes. In the latter case, the full grammar
+        is used, which also takes care of raising any |TokenError|.
+
+        """
+        m = cls._rx_token.fullmatch(token)
+
+        if m is None:
+            return None
+
+        pr = {TokenField.Type: token[0]}
+
+        for field in (
+            TokenField.SpaceAfter,
+            TokenField.Capture,
+            TokenField.Quantity,
+            TokenField.Str,
+        ):
+            val = m.group(field.value)
+            if val is not None:
+                pr[field] = val
 
-        return pattern
+        if m.group(TokenField.Number.value) is not None:
+            pr[TokenField.SignNumber] = {
+                TokenField.Sign: m.group(TokenField.Sign.value),
+                TokenField.Number: m.group(TokenField.Number.value),
+            }
 
-    def _get_misc_pattern(self):
+        return pr
+
+    @classmethod
+    def _string_pattern(cls, s):
+        """Create a literal string pattern from the parse result."""
+        return s.translate(cls._str_escapes)
+
+    @staticmethod
+    def _get_misc_pattern():
         """Return the no-whitespace item pattern.
 
         Lazy capture is probably the best approach here, for
@@ -294,35 +342,216 @@ class Token:
         """
         return r"[^ \t\n]+?"
 
-    def _get_number_pattern(self):
+    @classmethod
+    def _get_number_pattern(cls, sign_char, number_char):
         """Return the correct number pattern given the parse result."""
-        num = Number(self._pr[TokenField.SignNumber][TokenField.Number])
-        sign = Sign(self._pr[TokenField.SignNumber][TokenField.Sign])
-
-        return self._numpats[num, sign]
+        return cls._numpats_by_chars[sign_char + number_char]
 
     @classmethod
     def _group_open(cls):
         """Create the opening pattern for a named group.
 
-        This leaves a formatting placeholder for the invoking Parser
-        to inject the appropriate group ID.
+        This leaves a placeholder for the invoking Parser
+        to replace with the appropriate group ID.
 
         """
-        return r"(?P<{0}{{0}}>".format(cls.group_prefix)
+        return "(?P<" + cls.group_prefix + cls._s_group_id + ">"
 
     @staticmethod
     def _group_close():
         """Create the closing pattern for a named group."""
         return ")"
 
-    def _selective_group_enclose(self, pat):
+    @classmethod
+    def _selective_group_enclose(cls, pat, do_enclose):
         """Return token pattern enclosed in group IF it should be grouped.
 
-        FIX THIS DOCSTRING, IT'S OUT OF DATE!!!
+        Also returns a flag for whether the group ID placeholder
+        was inserted (and thus needs to be filled in by the Parser).
 
         """
-        if self.do_capture and self.capture:
-            return (self._group_open() + pat + self._group_close(), True)
+        if do_enclose:
+            return (cls._group_open() + pat + cls._group_close(), True)
         else:
             return pat, False
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_token(token, do_capture):
+    """Return the (cached) :class:`_TokenInfo` for a token string.
+
+    The parse result depends only on `token`, and the generated
+    pattern only on `token` and `do_capture`, so repeated
+    instantiation of the same |Token| reduces to a dict lookup.
+
+    """
+    return Token._parse(token, do_capture)
+
+
+#: Parse info for the most frequently used tokens, computed once at
+#: import. Consulted before :func:`_parse_token`, so these entries
+#: are never evicted from the LRU cache and cost only a dict lookup.
+_common_token_info = {
+    (tok, cap): Token._parse(tok, cap)
+    for tok in itt.chain(
+        (Content.Any.value, Content.Any.value + Token._s_capture),
+        (Content.OptionalLine.value,),
+        (
+            Content.Number.value + "".join(flags)
+            for flags in itt.product(
+                ("", Token._s_capture),
+                Token._s_quantity_chars,
+                Token._s_sign_chars,
+                Token._s_number_chars,
+            )
+        ),
+    )
+    for cap in (True, False)
+}
+
+
+def _token_info(token, do_capture):
+    """Return the :class:`_TokenInfo` for a token string.
+
+    Checks the precomputed :data:`_common_token_info` first, and
+    falls back to the LRU-cached :func:`_parse_token` otherwise.
+
+    """
+    info = _common_token_info.get((token, do_capture))
+
+    if info is None:
+        info = _parse_token(token, do_capture)
+
+    return info
+
+
+@functools.lru_cache(maxsize=1)
+def _pp_grammar():
+    """Build and return the pyparsing grammars for a token.
+
+    The compiled regex in :class:`Token` handles all well-formed
+    tokens without stray whitespace, so these fallback grammars (and
+    pyparsing itself) are only loaded on first need.
+
+    Returns a |dict| of grammars keyed by the token type marker
+    character, plus the combined grammar keyed by |None|.
+
+    """
+    import pyparsing as pp
+
+    # ## MINOR PATTERN COMPONENTS ##
+    pp_space_after = pp.Optional(
+        pp.Word(Token._s_space_after_chars, exact=1)
+    ).setResultsName(TokenField.SpaceAfter)
+    pp_capture = pp.Optional(pp.Literal(Token._s_capture)).setResultsName(
+        TokenField.Capture
+    )
+    pp_quantity = pp.Word(Token._s_quantity_chars, exact=1).setResultsName(
+        TokenField.Quantity
+    )
+
+    # ## OPTIONAL LINE TOKEN ##
+    pp_optional_line = pp.Literal(Content.OptionalLine.value).setResultsName(
+        TokenField.Type
+    )
+
+    # ## ARBITRARY CONTENT TOKEN ##
+    # Anything may be matched here, including multiple words.
+    pp_any_flag = (
+        pp.Literal(Token._s_any_flag).setResultsName(TokenField.Type)
+        + pp_capture
+    )
+
+    # ## LITERAL STRING TOKEN ##
+    # Marker for the rest of the token to be a literal string
+    pp_str_flag = pp.Literal(Content.String.value).setResultsName(
+        TokenField.Type
+    )
+
+    # Remainder of the content after the marker, spaces included
+    pp_str_value = pp.Word(pp.printables + " ").setResultsName(TokenField.Str)
+
+    # Composite pattern for a literal string
+    pp_string = (
+        pp_str_flag + pp_space_after + pp_capture + pp_quantity + pp_str_value
+    )
+
+    # ## MISC SINGLE VALUE TOKEN ##
+    # Initial marker for the 'misc' token
+    pp_misc_flag = pp.Literal(Content.Misc.value).setResultsName(
+        TokenField.Type
+    )
+
+    # Composite token pattern for the misc match
+    pp_misc = pp_misc_flag + pp_space_after + pp_capture + pp_quantity
+
+    # ## NUMERICAL VALUE TOKEN ##
+    # Initial marker for a numerical value
+    pp_num_flag = pp.Literal(Content.Number.value).setResultsName(
+        TokenField.Type
+    )
+
+    # Marker for the sign of the value; period indicates either sign
+    pp_num_sign = pp.Word(Token._s_sign_chars, exact=1).setResultsName(
+        TokenField.Sign
+    )
+
+    # Marker for the number type to look for
+    pp_num_type = pp.Word(Token._s_number_chars, exact=1).setResultsName(
+        TokenField.Number
+    )
+
+    # Composite pattern for a number
+    pp_number = (
+        pp_num_flag
+        + pp_space_after
+        + pp_capture
+        + pp_quantity
+        + pp.Group(pp_num_sign + pp_num_type).setResultsName(
+            TokenField.SignNumber
+        )
+    )
+
+    # ## COMPLETE TOKEN PARSERS ##
+    # Every alternative starts with a distinct marker character, so
+    # each token can be sent straight to its own parser.
+    # The combined parser is for tokens with leading whitespace; it
+    # tries the alternatives in order of their typical frequency.
+    # First-match (|) is equivalent to longest-match (^) here, and
+    # avoids trying every alternative on every parse.
+    by_marker = {
+        Content.Number.value: pp_number,
+        Content.String.value: pp_string,
+        Content.Any.value: pp_any_flag,
+        Content.Misc.value: pp_misc,
+        Content.OptionalLine.value: pp_optional_line,
+    }
+
+    grammars = {
+        k: (pp.StringStart() + v + pp.StringEnd()).streamline()
+        for k, v in by_marker.items()
+    }
+    grammars[None] = (
+        pp.StringStart()
+        + pp.MatchFirst(list(by_marker.values()))
+        + pp.StringEnd()
+    ).streamline()
+
+    return grammars
+
+
+def _pp_parse(token):
+    """Parse `token` with the pyparsing grammar.
+
+    Raises |TokenError| if `token` is invalid.
+
+    """
+    import pyparsing as pp
+
+    grammars = _pp_grammar()
+    grammar = grammars.get(token[:1], grammars[None])
+
+    try:
+        return grammar.parseString(token)
+    except pp.ParseException as e:
+        raise TokenError(token) from e
@@ -38,6 +38,8 @@ class AP(object):
 
     FAST = "fast"
 
+    TRIM = "trim"
+
     README = "readme"
 
     LIVE = "live"
@@ -73,6 +75,14 @@ def get_parser():
         action="store_true",
         help="Run only 'fast' tests",
     )
+    prs.add_argument(
+        AP.PFX.format(AP.TRIM),
+        action="store_true",
+        help=(
+            "Run the 'slow' tests with a reduced set of values "
+            "(same as setting the PENT_FAST_TESTS environment variable)"
+        ),
+    )
     prs.add_argument(
         AP.PFX.format(AP.README),
         action="store_true",
@@ -107,6 +117,7 @@ def get_parser():
 
 
 def main():
+    import os
     import sys
     import unittest as ut
 
@@ -121,6 +132,10 @@ def main():
     params = vars(ns)
     sys.argv = sys.argv[:1] + args_left
 
+    # Trim the slow tests if indicated; read by those tests at setup
+    if params[AP.TRIM]:
+        os.environ["PENT_FAST_TESTS"] = "1"
+
     # Create the empty test suite
     ts = ut.TestSuite()
 